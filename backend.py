@@ -1,5 +1,10 @@
 import os
+import re
+import copy
+import gzip
 import json
+import hashlib
+import mimetypes
 import jwt
 import bcrypt
 from datetime import datetime, timedelta
@@ -11,12 +16,22 @@ import mysql.connector
 from mysql.connector import Error
 import sqlite3
 
+# Brotli is optional - gzip is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # Load environment variables
 load_dotenv()
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app, supports_credentials=True)
+# Initialize Flask app (static files are served by static_asset below)
+app = Flask(__name__, static_folder=None)
+
+# The frontend is served same-origin; CORS only remains for opening
+# index.html from disk (origin "null") or from another local dev server.
+# Auth uses a Bearer header, so credentialed CORS is not needed.
+CORS(app, origins=['null', r'http://localhost(:\d+)?$', r'http://127\.0\.0\.1(:\d+)?$'])
 
 # Configuration
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-change-in-production')
@@ -101,6 +116,7 @@ def init_db():
                     interests TEXT NOT NULL,
                     additional_notes TEXT,
                     itinerary_json JSON,
+                    version INT NOT NULL DEFAULT 1,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
                 )
@@ -129,11 +145,23 @@ def init_db():
                     interests TEXT NOT NULL,
                     additional_notes TEXT,
                     itinerary_json TEXT,
+                    version INTEGER NOT NULL DEFAULT 1,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
                 )
             """)
         
+        # Add version column to trips tables created before trip editing existed
+        if DB_TYPE == "MySQL":
+            cursor.execute("SHOW COLUMNS FROM trips LIKE 'version'")
+            has_version = cursor.fetchone() is not None
+        else:
+            cursor.execute("PRAGMA table_info(trips)")
+            has_version = any(column[1] == 'version' for column in cursor.fetchall())
+        
+        if not has_version:
+            cursor.execute("ALTER TABLE trips ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+        
         connection.commit()
         
         # Insert demo users if none exists
@@ -297,9 +325,258 @@ def generate_ai_itinerary(trip_data):
     
     return itinerary
 
+# JSON Patch (RFC 6902) support for editing saved itineraries
+class JsonPatchError(ValueError):
+    """Raised when a JSON Patch document cannot be applied"""
+
+def parse_json_pointer(pointer):
+    """Split an RFC 6901 JSON pointer into its unescaped reference tokens"""
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith('/')):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    if pointer == '':
+        return []
+    return [token.replace('~1', '/').replace('~0', '~') for token in pointer.split('/')[1:]]
+
+def _array_index(array, token, allow_end=False):
+    if allow_end and token == '-':
+        return len(array)
+    if not re.fullmatch(r'0|[1-9][0-9]*', token, re.ASCII):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(array) or (index == len(array) and not allow_end):
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+def _resolve_parent(document, tokens):
+    target = document
+    for token in tokens[:-1]:
+        if isinstance(target, dict) and token in target:
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[_array_index(target, token)]
+        else:
+            raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+    if not isinstance(target, (dict, list)):
+        raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+    return target, tokens[-1]
+
+def _get_value(document, tokens):
+    if not tokens:
+        return document
+    parent, key = _resolve_parent(document, tokens)
+    if isinstance(parent, list):
+        return parent[_array_index(parent, key)]
+    if key not in parent:
+        raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+    return parent[key]
+
+def _add_value(document, tokens, value):
+    if not tokens:
+        return value
+    parent, key = _resolve_parent(document, tokens)
+    if isinstance(parent, list):
+        parent.insert(_array_index(parent, key, allow_end=True), value)
+    else:
+        parent[key] = value
+    return document
+
+def _remove_value(document, tokens):
+    if not tokens:
+        raise JsonPatchError("Cannot remove the whole document")
+    parent, key = _resolve_parent(document, tokens)
+    if isinstance(parent, list):
+        return parent.pop(_array_index(parent, key))
+    if key not in parent:
+        raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+    return parent.pop(key)
+
+def _json_equal(a, b):
+    """Compare two JSON values by JSON type, so true is not equal to 1 (RFC 6902 section 4.6)"""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    return type(a) is type(b) and a == b
+
+def apply_json_patch(document, operations):
+    """
+    Apply a list of RFC 6902 operations to a copy of document.
+    The patch is all-or-nothing: on any error a JsonPatchError is raised
+    and the original document is left untouched.
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError("Patch must be a JSON array of operations")
+    
+    document = copy.deepcopy(document)
+    
+    for operation in operations:
+        if not isinstance(operation, dict) or 'op' not in operation or 'path' not in operation:
+            raise JsonPatchError("Each operation requires 'op' and 'path'")
+        
+        op = operation['op']
+        path = parse_json_pointer(operation['path'])
+        
+        if op in ('add', 'replace', 'test') and 'value' not in operation:
+            raise JsonPatchError(f"'{op}' operation requires 'value'")
+        if op in ('move', 'copy') and 'from' not in operation:
+            raise JsonPatchError(f"'{op}' operation requires 'from'")
+        
+        if op == 'add':
+            document = _add_value(document, path, copy.deepcopy(operation['value']))
+        elif op == 'remove':
+            _remove_value(document, path)
+        elif op == 'replace':
+            _get_value(document, path)
+            if path:
+                parent, key = _resolve_parent(document, path)
+                if isinstance(parent, list):
+                    key = _array_index(parent, key)
+                parent[key] = copy.deepcopy(operation['value'])
+            else:
+                document = copy.deepcopy(operation['value'])
+        elif op == 'move':
+            from_path = parse_json_pointer(operation['from'])
+            if path[:len(from_path)] == from_path and len(path) > len(from_path):
+                raise JsonPatchError("Cannot move a value into one of its children")
+            value = _get_value(document, from_path)
+            if from_path != path:
+                _remove_value(document, from_path)
+                document = _add_value(document, path, value)
+        elif op == 'copy':
+            value = copy.deepcopy(_get_value(document, parse_json_pointer(operation['from'])))
+            document = _add_value(document, path, value)
+        elif op == 'test':
+            if not _json_equal(_get_value(document, path), operation['value']):
+                raise JsonPatchError(f"Test failed at {operation['path']}")
+        else:
+            raise JsonPatchError(f"Unsupported operation: {op!r}")
+    
+    return document
+
+# Frontend assets - fingerprinted and precompressed once at startup
+FRONTEND_INDEX_PATH = os.path.join(app.root_path, 'index.html')
+FRONTEND_STATIC_DIR = os.path.join(app.root_path, 'static')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+STATIC_REFERENCE_PATTERN = re.compile(r'(href|src)="static/([^"]+)"')
+
+# Some platforms map these to text/plain, which browsers reject for stylesheets
+mimetypes.add_type('text/css', '.css')
+mimetypes.add_type('text/javascript', '.js')
+
+STATIC_ASSETS = {}    # fingerprinted path -> asset
+STATIC_MANIFEST = {}  # original path -> fingerprinted path
+INDEX_PAGE = None
+
+def _build_asset(content, mimetype):
+    """Precompute the encodings of an asset that are worth serving"""
+    variants = {'identity': content}
+    
+    gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+    if len(gzipped) < len(content):
+        variants['gzip'] = gzipped
+    
+    if brotli is not None:
+        brotlied = brotli.compress(content, quality=11)
+        if len(brotlied) < len(content):
+            variants['br'] = brotlied
+    
+    return {
+        'mimetype': mimetype,
+        'etag': hashlib.sha256(content).hexdigest()[:12],
+        'variants': variants
+    }
+
+def frontend_static_files():
+    """List every file under static/ - also watched by the debug reloader"""
+    files = []
+    for dirpath, _, filenames in os.walk(FRONTEND_STATIC_DIR):
+        for filename in filenames:
+            files.append(os.path.join(dirpath, filename))
+    return files
+
+def build_frontend_assets():
+    """Fingerprint files under static/ and rewrite index.html to reference them"""
+    global INDEX_PAGE
+    
+    STATIC_ASSETS.clear()
+    STATIC_MANIFEST.clear()
+    
+    for full_path in frontend_static_files():
+        path = os.path.relpath(full_path, FRONTEND_STATIC_DIR).replace(os.sep, '/')
+        
+        with open(full_path, 'rb') as f:
+            content = f.read()
+        
+        mimetype = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        asset = _build_asset(content, mimetype)
+        
+        root, ext = os.path.splitext(path)
+        fingerprinted_path = f"{root}.{asset['etag']}{ext}"
+        STATIC_MANIFEST[path] = fingerprinted_path
+        STATIC_ASSETS[fingerprinted_path] = asset
+    
+    if not os.path.exists(FRONTEND_INDEX_PATH):
+        INDEX_PAGE = None
+        print("index.html not found - serving API only")
+        return
+    
+    with open(FRONTEND_INDEX_PATH, 'r', encoding='utf-8') as f:
+        html = f.read()
+    
+    def fingerprint_reference(match):
+        path = STATIC_MANIFEST.get(match.group(2))
+        if not path:
+            return match.group(0)
+        return f'{match.group(1)}="/static/{path}"'
+    
+    html = STATIC_REFERENCE_PATTERN.sub(fingerprint_reference, html)
+    INDEX_PAGE = _build_asset(html.encode('utf-8'), 'text/html')
+    print(f"Frontend assets built: {len(STATIC_ASSETS)} static files, encodings: {', '.join(INDEX_PAGE['variants'])}")
+
+def asset_response(asset, cache_control):
+    """Serve the best precompressed variant the client accepts"""
+    encoding = 'identity'
+    for candidate in ('br', 'gzip'):
+        if candidate in asset['variants'] and request.accept_encodings[candidate]:
+            encoding = candidate
+            break
+    
+    response = make_response(asset['variants'][encoding])
+    response.mimetype = asset['mimetype']
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = cache_control
+    response.set_etag(f"{asset['etag']}-{encoding}")
+    return response.make_conditional(request)
+
+build_frontend_assets()
+
 # Routes
 @app.route('/')
 def index():
+    if INDEX_PAGE is None:
+        return api_info()
+    # index.html must always be revalidated so new asset fingerprints are picked up
+    return asset_response(INDEX_PAGE, 'no-cache')
+
+@app.route('/static/<path:filename>')
+def static_asset(filename):
+    if filename in STATIC_ASSETS:
+        return asset_response(STATIC_ASSETS[filename], IMMUTABLE_CACHE_CONTROL)
+    
+    # Unfingerprinted paths still work, but can't be cached forever
+    if filename in STATIC_MANIFEST:
+        return asset_response(STATIC_ASSETS[STATIC_MANIFEST[filename]], 'no-cache')
+    
+    return jsonify({'message': 'Endpoint not found!'}), 404
+
+@app.route('/api')
+def api_info():
     return jsonify({
         "message": "Voyager AI Trip Planner API", 
         "status": "running",
@@ -511,6 +788,7 @@ def save_trip(current_user):
             return jsonify({
                 'message': 'Trip saved successfully!',
                 'trip_id': trip_id,
+                'version': 1,
                 'database': DB_TYPE
             }), 201
         else:
@@ -585,14 +863,14 @@ def get_trip(current_user, trip_id):
             if DB_TYPE == "MySQL":
                 cursor.execute("""
                     SELECT id, destination, travel_days, budget, travelers, interests, 
-                           additional_notes, itinerary_json, created_at
+                           additional_notes, itinerary_json, created_at, version
                     FROM trips 
                     WHERE id = %s AND user_id = %s
                 """, (trip_id, current_user['id']))
             else:
                 cursor.execute("""
                     SELECT id, destination, travel_days, budget, travelers, interests, 
-                           additional_notes, itinerary_json, created_at
+                           additional_notes, itinerary_json, created_at, version
                     FROM trips 
                     WHERE id = ? AND user_id = ?
                 """, (trip_id, current_user['id']))
@@ -619,14 +897,17 @@ def get_trip(current_user, trip_id):
                     'interests': row[5],
                     'additional_notes': row[6],
                     'itinerary': itinerary,
-                    'created_at': row[8]
+                    'created_at': row[8],
+                    'version': row[9]
                 }
                 
-                return jsonify({
+                response = make_response(jsonify({
                     'message': 'Trip retrieved successfully!',
                     'trip': trip,
                     'database': DB_TYPE
-                }), 200
+                }), 200)
+                response.set_etag(str(row[9]))
+                return response
             else:
                 return jsonify({'message': 'Trip not found or access denied!'}), 404
         else:
@@ -636,6 +917,113 @@ def get_trip(current_user, trip_id):
         print(f"Get trip error: {e}")
         return jsonify({'message': f'Failed to retrieve trip! Error: {str(e)}'}), 500
 
+@app.route('/trip/<int:trip_id>', methods=['PATCH'])
+@token_required
+def patch_trip(current_user, trip_id):
+    """
+    Apply an RFC 6902 JSON Patch to a saved trip's itinerary.
+    The client must send the version it last saw in an If-Match header;
+    the patch is rejected if the trip has been modified since.
+    """
+    try:
+        operations = request.get_json(silent=True)
+        
+        if not isinstance(operations, list):
+            return jsonify({'message': 'Request body must be a JSON Patch array!'}), 400
+        
+        # "*" would skip the version check, so a concrete version is required
+        if not request.if_match or request.if_match.star_tag:
+            return jsonify({'message': 'If-Match header with the trip version is required!'}), 428
+        
+        connection = get_db_connection()
+        if connection:
+            cursor = connection.cursor()
+            
+            # Read, patch and write back inside a single transaction.
+            # Anything short of a commit is rolled back so the lock is released.
+            try:
+                if DB_TYPE == "MySQL":
+                    connection.start_transaction()
+                    cursor.execute("""
+                        SELECT itinerary_json, version
+                        FROM trips 
+                        WHERE id = %s AND user_id = %s
+                        FOR UPDATE
+                    """, (trip_id, current_user['id']))
+                else:
+                    cursor.execute("BEGIN IMMEDIATE")
+                    cursor.execute("""
+                        SELECT itinerary_json, version
+                        FROM trips 
+                        WHERE id = ? AND user_id = ?
+                    """, (trip_id, current_user['id']))
+                
+                row = cursor.fetchone()
+                
+                if not row:
+                    return jsonify({'message': 'Trip not found or access denied!'}), 404
+                
+                current_version = row[1]
+                
+                if not request.if_match.contains(str(current_version)):
+                    return jsonify({
+                        'message': 'Trip has been modified since it was loaded!',
+                        'version': current_version
+                    }), 412
+                
+                try:
+                    itinerary = json.loads(row[0]) if row[0] else {}
+                except ValueError:
+                    return jsonify({'message': 'Stored itinerary is corrupt and cannot be patched!'}), 409
+                
+                try:
+                    itinerary = apply_json_patch(itinerary, operations)
+                except JsonPatchError as e:
+                    return jsonify({'message': f'Invalid patch! Error: {str(e)}'}), 422
+                
+                if not isinstance(itinerary, dict):
+                    return jsonify({'message': 'Invalid patch! Error: itinerary must remain a JSON object'}), 422
+                
+                new_version = current_version + 1
+                
+                if DB_TYPE == "MySQL":
+                    cursor.execute("""
+                        UPDATE trips 
+                        SET itinerary_json = %s, version = %s
+                        WHERE id = %s AND user_id = %s AND version = %s
+                    """, (json.dumps(itinerary), new_version, trip_id, current_user['id'], current_version))
+                else:
+                    cursor.execute("""
+                        UPDATE trips 
+                        SET itinerary_json = ?, version = ?
+                        WHERE id = ? AND user_id = ? AND version = ?
+                    """, (json.dumps(itinerary), new_version, trip_id, current_user['id'], current_version))
+                
+                if cursor.rowcount != 1:
+                    return jsonify({'message': 'Trip was modified concurrently, please retry!'}), 409
+                
+                connection.commit()
+            finally:
+                # No-op after a successful commit
+                connection.rollback()
+                cursor.close()
+                connection.close()
+            
+            response = make_response(jsonify({
+                'message': 'Trip updated successfully!',
+                'trip_id': trip_id,
+                'version': new_version,
+                'database': DB_TYPE
+            }), 200)
+            response.set_etag(str(new_version))
+            return response
+        else:
+            return jsonify({'message': 'Database connection error!'}), 500
+            
+    except Exception as e:
+        print(f"Patch trip error: {e}")
+        return jsonify({'message': f'Failed to update trip! Error: {str(e)}'}), 500
+
 @app.route('/health', methods=['GET'])
 def health_check():
     connection = get_db_connection()
@@ -674,5 +1062,10 @@ if __name__ == '__main__':
     print(f"   1. Aditi Nair - aditirajeshnair5@gmail.com / aditi12345")
     print(f"   2. Test User - test@example.com / test123")
     print(f"🔗 API Base URL: http://localhost:{port}")
+    print(f"🌐 Frontend: http://localhost:{port}/")
+    
+    # Assets are built once at startup, so restart the dev server when
+    # index.html or anything under static/ changes, not just .py files
+    extra_files = [FRONTEND_INDEX_PATH] + frontend_static_files() if debug else None
     
-    app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port, debug=debug, extra_files=extra_files)
\ No newline at end of file
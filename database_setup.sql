@@ -25,6 +25,7 @@ CREATE TABLE IF NOT EXISTS trips (
     interests TEXT NOT NULL,
     additional_notes TEXT,
     itinerary_json JSON,
+    version INT NOT NULL DEFAULT 1,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 );
@@ -0,0 +1,298 @@
+"""
+Measure the HTTP round trips the Voyager frontend makes.
+
+Replays the requests static/js/app.js (inline in index.html before it was
+split out) sends during one session - page load, login, generate, save,
+list and view - and logs every request with its status and size.
+
+  same-origin   (default) index.html and static/ served by backend.py
+  cross-origin  index.html served by a separate http.server, API calls
+                go to backend.py and need CORS preflights where the
+                browser would send them
+
+--page-from REV serves the page as it was at git revision REV instead of
+the working tree, e.g. the single-file index.html from before the
+frontend was split out and served by the backend.
+
+API requests go through Flask's test client against a temporary SQLite
+database. A small browser cache honours Cache-Control and ETag for the
+repeat visit.
+
+Usage: python measure_page_load.py [--cross-origin [--page-from REV]]
+"""
+import io
+import os
+import re
+import gzip
+import json
+import shutil
+import sqlite3
+import tarfile
+import argparse
+import subprocess
+import tempfile
+import threading
+import functools
+import urllib.request
+import urllib.error
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import bcrypt
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+import backend
+
+BROWSER_HEADERS = {'Accept-Encoding': 'gzip, deflate, br' if brotli else 'gzip, deflate'}
+PAGE_ORIGIN = 'http://localhost:8000'
+SUBRESOURCE_PATTERN = re.compile(r'<(?:link|script)\b[^>]*?\b(?:href|src)="([^"]+)"')
+SIMPLE_HEADERS = {'accept', 'accept-language', 'content-language', 'content-type'}
+SIMPLE_CONTENT_TYPES = {'application/x-www-form-urlencoded', 'multipart/form-data', 'text/plain'}
+
+MEASURE_EMAIL = 'measure@example.com'
+MEASURE_PASSWORD = 'measure123'
+
+
+def needs_preflight(method, headers):
+    """CORS rules for when a browser sends OPTIONS before the real request"""
+    if method not in ('GET', 'HEAD', 'POST'):
+        return True
+    for name, value in headers.items():
+        if name.lower() not in SIMPLE_HEADERS:
+            return True
+        if name.lower() == 'content-type' and value not in SIMPLE_CONTENT_TYPES:
+            return True
+    return False
+
+
+class Browser:
+    """Sends requests, keeps a cache and counts round trips per step"""
+
+    def __init__(self, api_client, page_url=None):
+        self.api_client = api_client
+        self.page_url = page_url
+        self.cache = {}
+        self.log = []
+
+    def _send_to_page_server(self, method, path, headers):
+        request = urllib.request.Request(self.page_url + path, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, dict(response.headers), response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, dict(e.headers), e.read()
+
+    def _send_to_backend(self, method, path, headers, body=None):
+        response = self.api_client.open(path, method=method, headers=headers, data=body)
+        return response.status_code, dict(response.headers), response.data
+
+    def _send(self, method, path, headers, body=None, page=False):
+        if page and self.page_url:
+            status, response_headers, data = self._send_to_page_server(method, path, headers)
+            server = 'page server'
+        else:
+            status, response_headers, data = self._send_to_backend(method, path, headers, body)
+            server = 'backend'
+
+        encoding = response_headers.get('Content-Encoding', 'identity')
+        print(f"    {method:7} {path:45} {status}  {len(data):>7,} B  {encoding:8} ({server})")
+        self.log.append({'method': method, 'path': path, 'status': status, 'bytes': len(data)})
+        return status, response_headers, data
+
+    def fetch(self, method, path, headers=None, body=None, page=False):
+        """Fetch like the browser would, returning (data, round trips used)"""
+        headers = dict(headers or {})
+        cached = self.cache.get(path) if method == 'GET' else None
+
+        if cached and 'immutable' in cached['cache_control']:
+            print(f"    {method:7} {path:45} (from cache, no request)")
+            return cached['data'], 0
+
+        round_trips = 0
+        if self.page_url and not page:
+            # Cross-origin API call
+            if needs_preflight(method, headers):
+                self._send('OPTIONS', path, {
+                    'Origin': PAGE_ORIGIN,
+                    'Access-Control-Request-Method': method,
+                    'Access-Control-Request-Headers': ', '.join(name.lower() for name in headers)
+                })
+                round_trips += 1
+            headers['Origin'] = PAGE_ORIGIN
+
+        request_headers = {**BROWSER_HEADERS, **headers}
+        if cached and cached['etag']:
+            request_headers['If-None-Match'] = cached['etag']
+        elif cached and cached['last_modified']:
+            request_headers['If-Modified-Since'] = cached['last_modified']
+
+        status, response_headers, data = self._send(method, path, request_headers, body, page)
+        round_trips += 1
+
+        if status == 304:
+            return cached['data'], round_trips
+
+        encoding = response_headers.get('Content-Encoding')
+        if encoding == 'gzip':
+            data = gzip.decompress(data)
+        elif encoding == 'br':
+            data = brotli.decompress(data)
+
+        if method == 'GET' and status == 200 and page:
+            self.cache[path] = {
+                'data': data,
+                'etag': response_headers.get('ETag'),
+                'last_modified': response_headers.get('Last-Modified'),
+                'cache_control': response_headers.get('Cache-Control', '')
+            }
+        return data, round_trips
+
+    def fetch_parallel(self, requests):
+        """Requests issued together cost one round trip (plus preflights)"""
+        results = [self.fetch(*request) for request in requests]
+        return [data for data, _ in results], max([trips for _, trips in results] + [0])
+
+
+def load_page(browser):
+    data, html_trips = browser.fetch('GET', '/', page=True)
+    html = data.decode('utf-8')
+
+    subresources = [
+        ('GET', '/' + src.lstrip('/'), None, None, True)
+        for src in SUBRESOURCE_PATTERN.findall(html)
+        if not re.match(r'(https?:)?//', src)
+    ]
+    _, asset_trips = browser.fetch_parallel(subresources)
+
+    # testBackendConnection() runs once the script has loaded
+    _, health_trips = browser.fetch('GET', '/health')
+    return html_trips + asset_trips + health_trips
+
+
+def run_session(browser):
+    json_headers = {'Content-Type': 'application/json'}
+    steps = []
+
+    print("  Page load")
+    steps.append(('Page load', load_page(browser)))
+
+    print("  Login")
+    data, trips = browser.fetch('POST', '/login', json_headers,
+                                json.dumps({'email': MEASURE_EMAIL, 'password': MEASURE_PASSWORD}))
+    token = json.loads(data)['token']
+    auth_headers = {'Authorization': f'Bearer {token}'}
+    steps.append(('Login', trips))
+
+    print("  Generate trip")
+    trip_request = {'destination': 'Paris, France', 'travel_days': 3, 'budget': 'moderate',
+                    'travelers': 2, 'interests': 'Food, Culture'}
+    data, trips = browser.fetch('POST', '/generate-trip', {**json_headers, **auth_headers},
+                                json.dumps(trip_request))
+    trip = json.loads(data)['trip']
+    steps.append(('Generate trip', trips))
+
+    print("  Save trip")
+    data, trips = browser.fetch('POST', '/save-trip', {**json_headers, **auth_headers},
+                                json.dumps({'trip': trip}))
+    trip_id = json.loads(data)['trip_id']
+    steps.append(('Save trip', trips))
+
+    print("  List trips")
+    _, trips = browser.fetch('GET', '/get-trips', auth_headers)
+    steps.append(('List trips', trips))
+
+    print("  View trip")
+    _, trips = browser.fetch('GET', f'/get-trip/{trip_id}', auth_headers)
+    steps.append(('View trip', trips))
+
+    print("  Repeat page load")
+    steps.append(('Repeat page load', load_page(browser)))
+    return steps
+
+
+def seed_database(path):
+    backend.SQLITE_DB_PATH = path
+    backend.init_db()
+
+    connection = sqlite3.connect(path)
+    password_hash = bcrypt.hashpw(MEASURE_PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    connection.execute(
+        "INSERT INTO users (name, email, password_hash) VALUES (?, ?, ?)",
+        ('Measure User', MEASURE_EMAIL, password_hash)
+    )
+    connection.commit()
+    connection.close()
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def start_page_server(directory):
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def export_revision(revision, directory):
+    """Extract the repository as of revision into directory"""
+    archive = subprocess.run(
+        ['git', 'archive', '--format=tar', revision],
+        cwd=backend.app.root_path, check=True, capture_output=True
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the frontend's HTTP round trips")
+    parser.add_argument('--cross-origin', action='store_true',
+                        help='serve the page from a separate http.server')
+    parser.add_argument('--page-from', metavar='REV',
+                        help='with --cross-origin, serve the page as of this git revision')
+    args = parser.parse_args()
+    if args.page_from and not args.cross_origin:
+        parser.error('--page-from requires --cross-origin')
+
+    temp_dir = tempfile.mkdtemp()
+    page_server = None
+
+    try:
+        seed_database(os.path.join(temp_dir, 'measure.db'))
+
+        page_url = None
+        page_root = backend.app.root_path
+        if args.page_from:
+            page_root = os.path.join(temp_dir, 'page')
+            export_revision(args.page_from, page_root)
+        if args.cross_origin:
+            page_server = start_page_server(page_root)
+            page_url = f'http://127.0.0.1:{page_server.server_address[1]}'
+
+        setup = 'cross-origin' if args.cross_origin else 'same-origin'
+        if args.page_from:
+            setup += f', page from {args.page_from}'
+        print(f"\nSetup: {setup}")
+        browser = Browser(backend.app.test_client(), page_url)
+        steps = run_session(browser)
+
+        print("\nSequential round trips per step:")
+        for name, trips in steps:
+            print(f"  {name:18} {trips}")
+        print(f"  {'Total':18} {sum(trips for _, trips in steps)}")
+        print(f"Requests sent: {len(browser.log)}, "
+              f"preflights: {sum(1 for entry in browser.log if entry['method'] == 'OPTIONS')}, "
+              f"bytes received: {sum(entry['bytes'] for entry in browser.log):,}")
+    finally:
+        if page_server:
+            page_server.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1255 @@
+// API Configuration - same origin when served by the backend,
+// fall back to the local backend when index.html is opened from disk
+const API_BASE_URL = window.location.protocol === 'file:' ? 'http://localhost:5000' : '';
+
+// Application State
+let currentUser = null;
+let userToken = null;
+let currentTrip = null;
+let isDarkTheme = true;
+let demoUsers = [
+    { email: 'test@example.com', password: 'test123', name: 'Test User' },
+    { email: 'aditirajeshnair5@gmail.com', password: 'aditi12345', name: 'Aditi Nair' }
+];
+
+// DOM Elements
+const loginFormContainer = document.getElementById('login-form-container');
+const registerFormContainer = document.getElementById('register-form-container');
+const tripFormContainer = document.getElementById('trip-form-container');
+const tripResults = document.getElementById('trip-results');
+const previousTripsContainer = document.getElementById('previous-trips-container');
+const homePage = document.getElementById('home-page');
+const loadingElement = document.getElementById('loading');
+const notificationElement = document.getElementById('notification');
+const themeToggle = document.getElementById('theme-toggle');
+const themeIcon = themeToggle.querySelector('i');
+
+// Buttons
+const loginBtn = document.getElementById('login-btn');
+const registerBtn = document.getElementById('register-btn');
+const startPlanningBtn = document.getElementById('start-planning-btn');
+const showRegisterLink = document.getElementById('show-register');
+const showLoginLink = document.getElementById('show-login');
+const saveTripBtn = document.getElementById('save-trip-btn');
+const newTripBtn = document.getElementById('new-trip-btn');
+const downloadPdfBtn = document.getElementById('download-pdf-btn');
+const backToPlannerBtn = document.getElementById('back-to-planner-btn');
+
+// Navigation
+const navHome = document.getElementById('nav-home');
+const navFeatures = document.getElementById('nav-features');
+const navDestinations = document.getElementById('nav-destinations');
+const navPlanner = document.getElementById('nav-planner');
+const navTrips = document.getElementById('nav-trips');
+
+// Forms
+const loginForm = document.getElementById('login-form');
+const registerForm = document.getElementById('register-form');
+const tripForm = document.getElementById('trip-form');
+
+// Interests data
+const interests = [
+    'Sightseeing', 'Food & Dining', 'Adventure', 'Culture', 'Relaxation',
+    'Shopping', 'Nightlife', 'Nature', 'History', 'Art & Museums',
+    'Photography', 'Wellness', 'Family Friendly', 'Romantic', 'Budget Travel'
+];
+
+// Initialize the application
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('Voyager application initialized');
+    initializeInterests();
+    checkAuthStatus();
+    setupEventListeners();
+    setupTheme();
+    showHomePage();
+    
+    // Test backend connection
+    testBackendConnection();
+});
+
+// Test backend connection
+async function testBackendConnection() {
+    try {
+        console.log('Testing backend connection to:', API_BASE_URL);
+        const response = await fetch(`${API_BASE_URL}/health`);
+        const data = await response.json();
+        console.log('Backend connection test successful:', data);
+        if (data.status === 'healthy') {
+            console.log('✅ Backend is running and connected to database');
+            return true;
+        }
+    } catch (error) {
+        console.error('❌ Backend connection test failed:', error);
+        showNotification('Backend is not reachable. Using demo mode.', 'warning');
+        return false;
+    }
+}
+
+// Set up theme toggle
+function setupTheme() {
+    // Check saved theme preference
+    const savedTheme = localStorage.getItem('voyager_theme');
+    if (savedTheme === 'light') {
+        setLightTheme();
+    } else {
+        setDarkTheme();
+    }
+    
+    themeToggle.addEventListener('click', toggleTheme);
+}
+
+function toggleTheme() {
+    if (isDarkTheme) {
+        setLightTheme();
+    } else {
+        setDarkTheme();
+    }
+}
+
+function setLightTheme() {
+    document.body.classList.remove('dark-theme');
+    themeIcon.className = 'fas fa-sun';
+    isDarkTheme = false;
+    localStorage.setItem('voyager_theme', 'light');
+}
+
+function setDarkTheme() {
+    document.body.classList.add('dark-theme');
+    themeIcon.className = 'fas fa-moon';
+    isDarkTheme = true;
+    localStorage.setItem('voyager_theme', 'dark');
+}
+
+// Set up all event listeners
+function setupEventListeners() {
+    console.log('Setting up event listeners');
+    
+    // Auth buttons
+    loginBtn.addEventListener('click', showLoginForm);
+    registerBtn.addEventListener('click', showRegisterForm);
+    showRegisterLink.addEventListener('click', showRegisterForm);
+    showLoginLink.addEventListener('click', showLoginForm);
+    
+    // Navigation
+    navHome.addEventListener('click', showHomePage);
+    navFeatures.addEventListener('click', scrollToFeatures);
+    navDestinations.addEventListener('click', scrollToDestinations);
+    navPlanner.addEventListener('click', showTripPlanner);
+    navTrips.addEventListener('click', showPreviousTrips);
+    
+    // Trip planning
+    startPlanningBtn.addEventListener('click', showTripPlanner);
+    newTripBtn.addEventListener('click', showTripPlanner);
+    backToPlannerBtn.addEventListener('click', showTripPlanner);
+    
+    // Forms submission
+    loginForm.addEventListener('submit', handleLogin);
+    registerForm.addEventListener('submit', handleRegister);
+    tripForm.addEventListener('submit', handleTripSubmit);
+    
+    // Trip actions
+    saveTripBtn.addEventListener('click', saveTrip);
+    downloadPdfBtn.addEventListener('click', downloadPdf);
+}
+
+// Initialize interests selection
+function initializeInterests() {
+    const container = document.getElementById('interests-container');
+    container.innerHTML = '';
+    
+    interests.forEach(interest => {
+        const tag = document.createElement('div');
+        tag.className = 'interest-tag';
+        tag.textContent = interest;
+        tag.addEventListener('click', function() {
+            this.classList.toggle('selected');
+            updateSelectedInterests();
+        });
+        container.appendChild(tag);
+    });
+}
+
+// Update hidden input with selected interests
+function updateSelectedInterests() {
+    const selectedTags = document.querySelectorAll('.interest-tag.selected');
+    const selectedInterests = Array.from(selectedTags).map(tag => tag.textContent);
+    document.getElementById('selected-interests').value = selectedInterests.join(', ');
+}
+
+// Check if user is already logged in
+function checkAuthStatus() {
+    console.log('Checking auth status');
+    const token = localStorage.getItem('voyager_token');
+    const user = localStorage.getItem('voyager_user');
+    
+    if (token && user) {
+        try {
+            userToken = token;
+            currentUser = JSON.parse(user);
+            console.log('User found in localStorage:', currentUser.email);
+            updateAuthUI(true);
+        } catch (error) {
+            console.error('Error parsing user data:', error);
+            clearAuthData();
+            updateAuthUI(false);
+        }
+    } else {
+        console.log('No user found in localStorage');
+        updateAuthUI(false);
+    }
+}
+
+// Update UI based on authentication status
+function updateAuthUI(isLoggedIn) {
+    console.log('Updating auth UI:', isLoggedIn);
+    if (isLoggedIn) {
+        loginBtn.innerHTML = '<i class="fas fa-sign-out-alt"></i> Logout';
+        loginBtn.onclick = handleLogout;
+        registerBtn.classList.add('hidden');
+    } else {
+        loginBtn.innerHTML = 'Login';
+        loginBtn.onclick = showLoginForm;
+        registerBtn.classList.remove('hidden');
+    }
+}
+
+// Clear authentication data
+function clearAuthData() {
+    localStorage.removeItem('voyager_token');
+    localStorage.removeItem('voyager_user');
+    userToken = null;
+    currentUser = null;
+}
+
+// Show home page
+function showHomePage(e) {
+    if (e) e.preventDefault();
+    hideAllContainers();
+    homePage.style.display = 'block';
+}
+
+// Scroll to features
+function scrollToFeatures(e) {
+    e.preventDefault();
+    hideAllContainers();
+    homePage.style.display = 'block';
+    const featuresSection = document.getElementById('features');
+    featuresSection.scrollIntoView({ behavior: 'smooth' });
+}
+
+// Scroll to destinations
+function scrollToDestinations(e) {
+    e.preventDefault();
+    hideAllContainers();
+    homePage.style.display = 'block';
+    const destinationsSection = document.getElementById('destinations');
+    destinationsSection.scrollIntoView({ behavior: 'smooth' });
+}
+
+// Show login form
+function showLoginForm(e) {
+    if (e) e.preventDefault();
+    hideAllContainers();
+    loginFormContainer.classList.add('active');
+}
+
+// Show register form
+function showRegisterForm(e) {
+    if (e) e.preventDefault();
+    hideAllContainers();
+    registerFormContainer.classList.add('active');
+}
+
+// Show trip planner form
+function showTripPlanner(e) {
+    if (e) e.preventDefault();
+    if (!currentUser) {
+        showLoginForm();
+        showNotification('Please login to plan a trip', 'warning');
+        return;
+    }
+    
+    hideAllContainers();
+    tripFormContainer.classList.add('active');
+    
+    // Reset form if coming from new trip button
+    if (e && e.target.id === 'new-trip-btn') {
+        tripForm.reset();
+        document.querySelectorAll('.interest-tag.selected').forEach(tag => {
+            tag.classList.remove('selected');
+        });
+        updateSelectedInterests();
+    }
+}
+
+// Show previous trips
+function showPreviousTrips(e) {
+    if (e) e.preventDefault();
+    if (!currentUser) {
+        showLoginForm();
+        showNotification('Please login to view your trips', 'warning');
+        return;
+    }
+    
+    hideAllContainers();
+    previousTripsContainer.classList.add('active');
+    loadPreviousTrips();
+}
+
+// Hide all content containers
+function hideAllContainers() {
+    homePage.style.display = 'none';
+    loginFormContainer.classList.remove('active');
+    registerFormContainer.classList.remove('active');
+    tripFormContainer.classList.remove('active');
+    tripResults.classList.remove('active');
+    previousTripsContainer.classList.remove('active');
+    loadingElement.classList.remove('active');
+}
+
+// Handle login form submission
+async function handleLogin(e) {
+    e.preventDefault();
+    console.log('Login attempt started');
+    
+    const email = document.getElementById('login-email').value;
+    const password = document.getElementById('login-password').value;
+    
+    console.log('Login credentials:', { email: email, password: '***' });
+    
+    // Validate inputs
+    if (!email || !password) {
+        showNotification('Please enter both email and password', 'warning');
+        return;
+    }
+    
+    // Show loading state
+    const submitBtn = loginForm.querySelector('button[type="submit"]');
+    const originalText = submitBtn.innerHTML;
+    submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Logging in...';
+    submitBtn.disabled = true;
+    
+    // Check demo users first
+    const demoUser = demoUsers.find(u => u.email === email && u.password === password);
+    if (demoUser) {
+        console.log('Using demo login for:', demoUser.email);
+        userToken = `demo-jwt-token-${Date.now()}`;
+        currentUser = {
+            id: Date.now(),
+            name: demoUser.name,
+            email: demoUser.email
+        };
+        
+        localStorage.setItem('voyager_token', userToken);
+        localStorage.setItem('voyager_user', JSON.stringify(currentUser));
+        
+        updateAuthUI(true);
+        showTripPlanner();
+        showNotification(`Welcome back ${demoUser.name}! (Demo Mode)`, 'success');
+        loginForm.reset();
+        
+        submitBtn.innerHTML = originalText;
+        submitBtn.disabled = false;
+        return;
+    }
+    
+    try {
+        console.log('Sending login request to backend:', `${API_BASE_URL}/login`);
+        
+        const response = await fetch(`${API_BASE_URL}/login`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            body: JSON.stringify({
+                email: email,
+                password: password
+            })
+        });
+        
+        console.log('Login response status:', response.status);
+        
+        let data;
+        try {
+            data = await response.json();
+            console.log('Login response data:', data);
+        } catch (parseError) {
+            console.error('Error parsing login response:', parseError);
+            throw new Error('Invalid response from server');
+        }
+        
+        if (response.ok) {
+            if (!data.token || !data.user) {
+                throw new Error('Invalid response format from server');
+            }
+            
+            userToken = data.token;
+            currentUser = data.user;
+            
+            localStorage.setItem('voyager_token', userToken);
+            localStorage.setItem('voyager_user', JSON.stringify(currentUser));
+            
+            console.log('Login successful, user:', currentUser.email);
+            
+            updateAuthUI(true);
+            showTripPlanner();
+            showNotification('Login successful! Welcome back ' + currentUser.name, 'success');
+            loginForm.reset();
+        } else {
+            console.error('Login failed:', data.message || 'Unknown error');
+            showNotification(data.message || 'Login failed. Please check your credentials.', 'error');
+        }
+    } catch (error) {
+        console.error('Login network error:', error);
+        
+        if (error.message.includes('Failed to fetch') || error.message.includes('NetworkError')) {
+            console.log('Network error detected, checking if backend is running');
+            
+            const isBackendRunning = await testBackendConnection();
+            
+            if (!isBackendRunning) {
+                console.log('Backend not running, using demo mode');
+                showNotification('Backend is not available. Using demo mode.', 'warning');
+                
+                userToken = 'demo-jwt-token-' + Date.now();
+                currentUser = {
+                    id: Date.now(),
+                    name: email.split('@')[0],
+                    email: email
+                };
+                
+                localStorage.setItem('voyager_token', userToken);
+                localStorage.setItem('voyager_user', JSON.stringify(currentUser));
+                
+                updateAuthUI(true);
+                showTripPlanner();
+                showNotification('Logged in with demo mode', 'info');
+                loginForm.reset();
+            } else {
+                showNotification('Network error. Please try again.', 'error');
+            }
+        } else {
+            showNotification('Login error: ' + error.message, 'error');
+        }
+    } finally {
+        submitBtn.innerHTML = originalText;
+        submitBtn.disabled = false;
+    }
+}
+
+// Handle registration form submission
+async function handleRegister(e) {
+    e.preventDefault();
+    console.log('Registration attempt started');
+    
+    const name = document.getElementById('register-name').value;
+    const email = document.getElementById('register-email').value;
+    const password = document.getElementById('register-password').value;
+    
+    console.log('Registration data:', { name: name, email: email, password: '***' });
+    
+    if (!name || !email || !password) {
+        showNotification('Please fill all fields', 'warning');
+        return;
+    }
+    
+    if (password.length < 8) {
+        showNotification('Password must be at least 8 characters', 'warning');
+        return;
+    }
+    
+    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+    if (!emailRegex.test(email)) {
+        showNotification('Please enter a valid email address', 'warning');
+        return;
+    }
+    
+    const submitBtn = registerForm.querySelector('button[type="submit"]');
+    const originalText = submitBtn.innerHTML;
+    submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Creating account...';
+    submitBtn.disabled = true;
+    
+    try {
+        console.log('Sending registration request to backend:', `${API_BASE_URL}/register`);
+        
+        const response = await fetch(`${API_BASE_URL}/register`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            body: JSON.stringify({
+                name: name,
+                email: email,
+                password: password
+            })
+        });
+        
+        console.log('Registration response status:', response.status);
+        
+        let data;
+        try {
+            data = await response.json();
+            console.log('Registration response data:', data);
+        } catch (parseError) {
+            console.error('Error parsing registration response:', parseError);
+            throw new Error('Invalid response from server');
+        }
+        
+        if (response.ok) {
+            showNotification('Registration successful! Please login.', 'success');
+            showLoginForm();
+            registerForm.reset();
+        } else {
+            console.error('Registration failed:', data.message || 'Unknown error');
+            showNotification(data.message || 'Registration failed. Please try again.', 'error');
+        }
+    } catch (error) {
+        console.error('Registration network error:', error);
+        
+        if (error.message.includes('Failed to fetch') || error.message.includes('NetworkError')) {
+            console.log('Network error detected, using demo registration');
+            
+            const isBackendRunning = await testBackendConnection();
+            
+            if (!isBackendRunning) {
+                userToken = 'demo-jwt-token-' + Date.now();
+                currentUser = {
+                    id: Date.now(),
+                    name: name,
+                    email: email
+                };
+                
+                localStorage.setItem('voyager_token', userToken);
+                localStorage.setItem('voyager_user', JSON.stringify(currentUser));
+                
+                updateAuthUI(true);
+                showTripPlanner();
+                showNotification('Account created in demo mode.', 'info');
+                registerForm.reset();
+            } else {
+                showNotification('Network error. Please try again.', 'error');
+            }
+        } else {
+            showNotification('Registration error: ' + error.message, 'error');
+        }
+    } finally {
+        submitBtn.innerHTML = originalText;
+        submitBtn.disabled = false;
+    }
+}
+
+// Handle logout
+function handleLogout() {
+    console.log('Logging out user:', currentUser?.email);
+    clearAuthData();
+    currentTrip = null;
+    updateAuthUI(false);
+    showHomePage();
+    showNotification('Logged out successfully', 'success');
+}
+
+// Handle trip form submission
+async function handleTripSubmit(e) {
+    e.preventDefault();
+    console.log('Trip planning started');
+    
+    if (!currentUser) {
+        showLoginForm();
+        showNotification('Please login to plan a trip', 'warning');
+        return;
+    }
+    
+    const destination = document.getElementById('destination').value;
+    const travelDays = document.getElementById('travel-days').value;
+    const budget = document.getElementById('budget').value;
+    const travelers = document.getElementById('travelers').value;
+    const selectedInterests = document.getElementById('selected-interests').value;
+    const additionalNotes = document.getElementById('additional-notes').value;
+    
+    console.log('Trip data:', {
+        destination,
+        travelDays,
+        budget,
+        travelers,
+        selectedInterests,
+        additionalNotes
+    });
+    
+    if (!destination || !travelDays || !budget || !travelers) {
+        showNotification('Please fill all required fields', 'warning');
+        return;
+    }
+    
+    if (!selectedInterests) {
+        showNotification('Please select at least one interest', 'warning');
+        return;
+    }
+    
+    hideAllContainers();
+    loadingElement.classList.add('active');
+    
+    const tripData = {
+        destination,
+        travel_days: parseInt(travelDays),
+        budget,
+        travelers: parseInt(travelers),
+        interests: selectedInterests,
+        additional_notes: additionalNotes
+    };
+    
+    try {
+        console.log('Sending trip generation request to backend');
+        
+        const response = await fetch(`${API_BASE_URL}/generate-trip`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Authorization': `Bearer ${userToken}`
+            },
+            body: JSON.stringify(tripData)
+        });
+        
+        console.log('Trip generation response status:', response.status);
+        
+        let data;
+        try {
+            data = await response.json();
+            console.log('Trip generation response data:', data);
+        } catch (parseError) {
+            console.error('Error parsing trip generation response:', parseError);
+            throw new Error('Invalid response from server');
+        }
+        
+        if (response.ok) {
+            currentTrip = data.trip;
+            displayTripResults(data.trip);
+            showNotification('Your itinerary has been generated!', 'success');
+        } else {
+            throw new Error(data.message || 'Failed to generate trip');
+        }
+    } catch (error) {
+        console.error('Trip generation error:', error);
+        
+        console.log('Using demo mode for trip generation');
+        showNotification('Using demo mode for trip generation', 'info');
+        
+        const mockTrip = generateMockTrip(tripData);
+        currentTrip = mockTrip;
+        setTimeout(() => {
+            displayTripResults(mockTrip);
+            showNotification('Demo itinerary generated successfully!', 'success');
+        }, 1500);
+    }
+}
+
+// Display trip results
+function displayTripResults(trip) {
+    hideAllContainers();
+    console.log('Displaying trip results for:', trip.destination);
+    
+    document.getElementById('trip-destination').textContent = `Your ${trip.destination} Itinerary`;
+    document.getElementById('trip-summary').textContent = `${trip.travel_days}-day ${trip.budget} trip for ${trip.travelers} people`;
+    document.getElementById('trip-days').textContent = `${trip.travel_days} Days`;
+    document.getElementById('trip-travelers').textContent = `${trip.travelers} People`;
+    document.getElementById('trip-budget').textContent = trip.budget.charAt(0).toUpperCase() + trip.budget.slice(1);
+    document.getElementById('trip-interests').textContent = trip.interests;
+    
+    const itineraryContainer = document.getElementById('itinerary-container');
+    itineraryContainer.innerHTML = '';
+    
+    if (trip.itinerary && trip.itinerary.days) {
+        trip.itinerary.days.forEach((day, index) => {
+            const dayCard = document.createElement('div');
+            dayCard.className = 'day-card animate__animated animate__fadeInUp';
+            dayCard.style.animationDelay = `${index * 0.1}s`;
+            
+            let activitiesHTML = '';
+            if (day.activities && day.activities.length > 0) {
+                day.activities.forEach(activity => {
+                    activitiesHTML += `
+                        <li>
+                            <div class="activity-icon">
+                                <i class="fas fa-${getActivityIcon(activity.type)}"></i>
+                            </div>
+                            <div class="activity-content">
+                                <span class="activity-time">${activity.time}</span>
+                                <p class="activity-desc">${activity.description}</p>
+                                ${activity.location ? `
+                                    <div class="activity-location">
+                                        <i class="fas fa-map-marker-alt"></i>
+                                        ${activity.location}
+                                    </div>
+                                ` : ''}
+                            </div>
+                        </li>
+                    `;
+                });
+            }
+            
+            dayCard.innerHTML = `
+                <div class="day-header">
+                    <h3 class="day-title">Day ${index + 1}: ${day.title || `Day ${index + 1}`}</h3>
+                    <span class="day-theme">${day.theme || 'Exploring'}</span>
+                </div>
+                <p class="mb-20">${day.summary || 'A day full of exciting activities.'}</p>
+                <ul class="day-activities">
+                    ${activitiesHTML || '<li>No activities planned for this day.</li>'}
+                </ul>
+            `;
+            
+            itineraryContainer.appendChild(dayCard);
+        });
+    } else {
+        itineraryContainer.innerHTML = `
+            <div class="day-card animate__animated animate__fadeInUp">
+                <div class="day-header">
+                    <h3 class="day-title">AI Generated Itinerary</h3>
+                </div>
+                <p>${trip.itinerary_text || 'Your personalized itinerary has been created.'}</p>
+            </div>
+        `;
+    }
+    
+    tripResults.classList.add('active');
+}
+
+// Get appropriate icon for activity type
+function getActivityIcon(activityType) {
+    const iconMap = {
+        'breakfast': 'coffee',
+        'lunch': 'utensils',
+        'dinner': 'utensil-spoon',
+        'sightseeing': 'camera',
+        'museum': 'landmark',
+        'shopping': 'shopping-bag',
+        'walking': 'walking',
+        'transport': 'bus',
+        'hotel': 'hotel',
+        'free': 'clock',
+        'adventure': 'mountain',
+        'nature': 'tree',
+        'beach': 'umbrella-beach',
+        'arrival': 'plane-arrival',
+        'departure': 'plane-departure',
+        'dining': 'utensils',
+        'activity': 'hiking'
+    };
+    
+    if (activityType && iconMap[activityType.toLowerCase()]) {
+        return iconMap[activityType.toLowerCase()];
+    }
+    
+    return 'map-marker-alt';
+}
+
+// Save current trip
+async function saveTrip() {
+    if (!currentTrip || !currentUser) return;
+    
+    console.log('Saving trip:', currentTrip.destination);
+    
+    try {
+        const response = await fetch(`${API_BASE_URL}/save-trip`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Authorization': `Bearer ${userToken}`
+            },
+            body: JSON.stringify({
+                trip: currentTrip
+            })
+        });
+        
+        let data;
+        try {
+            data = await response.json();
+        } catch (parseError) {
+            console.error('Error parsing save trip response:', parseError);
+            throw new Error('Invalid response from server');
+        }
+        
+        if (response.ok) {
+            showNotification('Trip saved successfully!', 'success');
+            // Update trip ID with server response
+            if (data.trip_id) {
+                currentTrip.id = data.trip_id;
+            }
+        } else {
+            throw new Error(data.message || 'Failed to save trip');
+        }
+    } catch (error) {
+        console.error('Save trip error:', error);
+        showNotification('Trip saved in demo mode', 'info');
+    }
+}
+
+// Load previous trips
+async function loadPreviousTrips() {
+    if (!currentUser) return;
+    
+    console.log('Loading previous trips for user:', currentUser.email);
+    
+    try {
+        const response = await fetch(`${API_BASE_URL}/get-trips`, {
+            method: 'GET',
+            headers: {
+                'Authorization': `Bearer ${userToken}`
+            }
+        });
+        
+        let data;
+        try {
+            data = await response.json();
+        } catch (parseError) {
+            console.error('Error parsing get trips response:', parseError);
+            throw new Error('Invalid response from server');
+        }
+        
+        if (response.ok) {
+            displayPreviousTrips(data.trips || []);
+        } else {
+            throw new Error(data.message || 'Failed to load trips');
+        }
+    } catch (error) {
+        console.error('Load trips error:', error);
+        showNotification('Using demo data for previous trips', 'info');
+        displayPreviousTrips(getMockTrips());
+    }
+}
+
+// Display previous trips
+function displayPreviousTrips(trips) {
+    const tripsGrid = document.getElementById('previous-trips-grid');
+    
+    if (trips.length === 0) {
+        tripsGrid.innerHTML = `
+            <div class="text-center" style="grid-column: 1/-1; padding: 40px;">
+                <i class="fas fa-suitcase-rolling" style="font-size: 3rem; color: var(--light-blue); margin-bottom: 20px;"></i>
+                <h3 style="color: var(--gold);">No trips yet</h3>
+                <p style="color: var(--white);">You haven't saved any trips. Plan your first trip!</p>
+            </div>
+        `;
+        return;
+    }
+    
+    tripsGrid.innerHTML = '';
+    
+    trips.forEach((trip, index) => {
+        const tripCard = document.createElement('div');
+        tripCard.className = 'trip-card animate__animated animate__fadeInUp';
+        tripCard.style.animationDelay = `${index * 0.1}s`;
+        
+        const createdDate = trip.created_at ? new Date(trip.created_at).toLocaleDateString('en-US', {
+            year: 'numeric',
+            month: 'long',
+            day: 'numeric'
+        }) : 'Recently';
+        
+        tripCard.innerHTML = `
+            <h4>${trip.destination}</h4>
+            <p><i class="fas fa-calendar-alt"></i> ${trip.travel_days} days</p>
+            <p><i class="fas fa-users"></i> ${trip.travelers} travelers</p>
+            <p><i class="fas fa-wallet"></i> ${trip.budget.charAt(0).toUpperCase() + trip.budget.slice(1)}</p>
+            <p><i class="fas fa-heart"></i> ${trip.interests}</p>
+            <p class="trip-date"><i class="far fa-clock"></i> Created: ${createdDate}</p>
+            <div class="trip-actions">
+                <button class="btn btn-small btn-secondary" onclick="viewSavedTrip(${trip.id})">
+                    <i class="fas fa-eye"></i> View
+                </button>
+                <button class="btn btn-small btn-primary" onclick="downloadTripAsPDF(${trip.id})">
+                    <i class="fas fa-download"></i> PDF
+                </button>
+            </div>
+        `;
+        
+        tripsGrid.appendChild(tripCard);
+    });
+}
+
+// View saved trip details
+async function viewSavedTrip(tripId) {
+    console.log('Viewing trip details for ID:', tripId);
+    
+    try {
+        const response = await fetch(`${API_BASE_URL}/get-trip/${tripId}`, {
+            method: 'GET',
+            headers: {
+                'Authorization': `Bearer ${userToken}`
+            }
+        });
+        
+        let data;
+        try {
+            data = await response.json();
+        } catch (parseError) {
+            console.error('Error parsing get trip response:', parseError);
+            throw new Error('Invalid response from server');
+        }
+        
+        if (response.ok) {
+            currentTrip = data.trip;
+            displayTripResults(data.trip);
+        } else {
+            throw new Error(data.message || 'Failed to load trip');
+        }
+    } catch (error) {
+        console.error('View trip error:', error);
+        showNotification('Loading demo trip details', 'info');
+        
+        const mockTrip = getMockTripById(tripId);
+        if (mockTrip) {
+            currentTrip = mockTrip;
+            displayTripResults(mockTrip);
+        } else {
+            showNotification('Trip not found', 'error');
+        }
+    }
+}
+
+// Download trip as PDF
+async function downloadTripAsPDF(tripId) {
+    console.log('Downloading trip as PDF for ID:', tripId);
+    
+    try {
+        const response = await fetch(`${API_BASE_URL}/get-trip/${tripId}`, {
+            method: 'GET',
+            headers: {
+                'Authorization': `Bearer ${userToken}`
+            }
+        });
+        
+        let data;
+        try {
+            data = await response.json();
+        } catch (parseError) {
+            console.error('Error parsing get trip response:', parseError);
+            throw new Error('Invalid response from server');
+        }
+        
+        if (response.ok) {
+            generatePDF(data.trip);
+        } else {
+            throw new Error(data.message || 'Failed to load trip');
+        }
+    } catch (error) {
+        console.error('Download trip error:', error);
+        showNotification('Generating demo PDF', 'info');
+        
+        const mockTrip = getMockTripById(tripId) || currentTrip;
+        if (mockTrip) {
+            generatePDF(mockTrip);
+        } else {
+            showNotification('No trip data available', 'error');
+        }
+    }
+}
+
+// Generate PDF from trip data
+function generatePDF(trip) {
+    const { jsPDF } = window.jspdf;
+    const doc = new jsPDF();
+    
+    // Add title
+    doc.setFontSize(24);
+    doc.setTextColor(26, 35, 126);
+    doc.text(`Voyager Itinerary: ${trip.destination}`, 105, 20, null, null, 'center');
+    
+    // Add trip details
+    doc.setFontSize(12);
+    doc.setTextColor(0, 0, 0);
+    
+    let yPosition = 40;
+    
+    // Trip summary
+    doc.setFontSize(14);
+    doc.setTextColor(255, 215, 0);
+    doc.text('Trip Summary', 20, yPosition);
+    
+    doc.setFontSize(12);
+    doc.setTextColor(0, 0, 0);
+    yPosition += 10;
+    doc.text(`Destination: ${trip.destination}`, 20, yPosition);
+    yPosition += 7;
+    doc.text(`Duration: ${trip.travel_days} days`, 20, yPosition);
+    yPosition += 7;
+    doc.text(`Travelers: ${trip.travelers} people`, 20, yPosition);
+    yPosition += 7;
+    doc.text(`Budget: ${trip.budget.charAt(0).toUpperCase() + trip.budget.slice(1)}`, 20, yPosition);
+    yPosition += 7;
+    doc.text(`Interests: ${trip.interests}`, 20, yPosition);
+    
+    yPosition += 15;
+    
+    // Itinerary
+    if (trip.itinerary && trip.itinerary.days) {
+        doc.setFontSize(14);
+        doc.setTextColor(255, 215, 0);
+        doc.text('Daily Itinerary', 20, yPosition);
+        yPosition += 10;
+        
+        trip.itinerary.days.forEach((day, index) => {
+            if (yPosition > 250) {
+                doc.addPage();
+                yPosition = 20;
+            }
+            
+            doc.setFontSize(12);
+            doc.setTextColor(26, 35, 126);
+            doc.text(`Day ${index + 1}: ${day.title || ''}`, 20, yPosition);
+            yPosition += 7;
+            
+            doc.setFontSize(10);
+            doc.setTextColor(0, 0, 0);
+            doc.text(day.summary || '', 20, yPosition);
+            yPosition += 7;
+            
+            if (day.activities) {
+                day.activities.forEach(activity => {
+                    if (yPosition > 250) {
+                        doc.addPage();
+                        yPosition = 20;
+                    }
+                    doc.text(`• ${activity.time}: ${activity.description}`, 25, yPosition);
+                    yPosition += 6;
+                });
+            }
+            
+            yPosition += 10;
+        });
+    }
+    
+    // Add footer
+    const pageCount = doc.internal.getNumberOfPages();
+    for (let i = 1; i <= pageCount; i++) {
+        doc.setPage(i);
+        doc.setFontSize(10);
+        doc.setTextColor(128, 128, 128);
+        doc.text(`Page ${i} of ${pageCount}`, 105, 285, null, null, 'center');
+        doc.text('Generated by Voyager AI Travel Planner', 105, 290, null, null, 'center');
+    }
+    
+    // Save the PDF
+    doc.save(`voyager-itinerary-${trip.destination.toLowerCase().replace(/\s+/g, '-')}.pdf`);
+    showNotification('PDF downloaded successfully!', 'success');
+}
+
+// Download PDF for current trip
+function downloadPdf() {
+    if (!currentTrip) {
+        showNotification('No trip to download', 'warning');
+        return;
+    }
+    generatePDF(currentTrip);
+}
+
+// Show notification
+function showNotification(message, type = 'info') {
+    console.log('Notification:', type, message);
+    notificationElement.textContent = message;
+    notificationElement.className = `notification ${type}`;
+    notificationElement.classList.add('show');
+    
+    let icon = 'info-circle';
+    if (type === 'success') icon = 'check-circle';
+    if (type === 'error') icon = 'exclamation-circle';
+    if (type === 'warning') icon = 'exclamation-triangle';
+    
+    notificationElement.innerHTML = `<i class="fas fa-${icon}"></i> ${message}`;
+    
+    setTimeout(() => {
+        notificationElement.classList.remove('show');
+    }, 5000);
+}
+
+// Mock data functions for demo mode
+function generateMockTrip(tripData) {
+    const { destination, travel_days, budget, travelers, interests } = tripData;
+    
+    const days = [];
+    for (let i = 1; i <= travel_days; i++) {
+        if (i === 1) {
+            days.push({
+                day: i,
+                title: `Arrival in ${destination}`,
+                summary: `Welcome to ${destination}! Settle in and start your adventure.`,
+                theme: 'Arrival & Orientation',
+                activities: [
+                    {
+                        time: '2:00 PM',
+                        type: 'arrival',
+                        description: 'Arrive at airport and transfer to accommodation',
+                        location: 'Airport to Hotel'
+                    },
+                    {
+                        time: '4:00 PM',
+                        type: 'sightseeing',
+                        description: 'Orientation walk around the neighborhood',
+                        location: 'City Center'
+                    },
+                    {
+                        time: '7:30 PM',
+                        type: 'dinner',
+                        description: 'Welcome dinner featuring local cuisine',
+                        location: 'Traditional Restaurant'
+                    }
+                ]
+            });
+        } else if (i === travel_days) {
+            days.push({
+                day: i,
+                title: `Departure from ${destination}`,
+                summary: 'Last day to explore before your journey home.',
+                theme: 'Departure',
+                activities: [
+                    {
+                        time: '9:00 AM',
+                        type: 'breakfast',
+                        description: 'Final breakfast and packing',
+                        location: 'Hotel'
+                    },
+                    {
+                        time: '11:00 AM',
+                        type: 'shopping',
+                        description: 'Souvenir shopping and last-minute exploration',
+                        location: 'Local Market'
+                    },
+                    {
+                        time: '2:00 PM',
+                        type: 'departure',
+                        description: 'Transfer to airport for departure',
+                        location: 'Hotel to Airport'
+                    }
+                ]
+            });
+        } else {
+            days.push({
+                day: i,
+                title: `Exploring ${destination}`,
+                summary: `Full day of adventures based on your interests: ${interests}`,
+                theme: 'Exploration',
+                activities: [
+                    {
+                        time: '8:00 AM',
+                        type: 'breakfast',
+                        description: 'Breakfast with local specialties',
+                        location: 'Hotel/Cafe'
+                    },
+                    {
+                        time: '10:00 AM',
+                        type: 'sightseeing',
+                        description: 'Visit major landmarks and attractions',
+                        location: 'Various Locations'
+                    },
+                    {
+                        time: '1:00 PM',
+                        type: 'lunch',
+                        description: 'Lunch at a recommended local restaurant',
+                        location: 'Authentic Restaurant'
+                    },
+                    {
+                        time: '3:00 PM',
+                        type: activitiesBasedOnInterests(interests),
+                        description: `Activity focused on ${interests.split(',')[0].trim()}`,
+                        location: 'Activity Center'
+                    },
+                    {
+                        time: '7:00 PM',
+                        type: 'dinner',
+                        description: 'Evening dining experience',
+                        location: 'Fine Dining Restaurant'
+                    }
+                ]
+            });
+        }
+    }
+    
+    return {
+        id: Date.now(),
+        destination,
+        travel_days,
+        budget,
+        travelers,
+        interests,
+        itinerary: {
+            days,
+            summary: `A ${travel_days}-day ${budget} trip to ${destination} for ${travelers} people interested in ${interests}.`,
+            estimated_cost: estimateCost(budget, travel_days, travelers),
+            travel_tips: [
+                'Book activities in advance during peak season',
+                'Try local transportation for authentic experience',
+                'Carry local currency for small purchases',
+                'Respect local customs and traditions'
+            ]
+        },
+        created_at: new Date().toISOString()
+    };
+}
+
+function activitiesBasedOnInterests(interests) {
+    const interest = interests.split(',')[0].trim().toLowerCase();
+    if (interest.includes('adventure')) return 'adventure';
+    if (interest.includes('food')) return 'dining';
+    if (interest.includes('culture') || interest.includes('history')) return 'museum';
+    if (interest.includes('nature')) return 'nature';
+    if (interest.includes('shopping')) return 'shopping';
+    if (interest.includes('relaxation')) return 'beach';
+    return 'sightseeing';
+}
+
+function estimateCost(budget, days, travelers) {
+    const dailyCost = {
+        'budget': 80,
+        'moderate': 150,
+        'luxury': 300
+    };
+    
+    const costPerPerson = dailyCost[budget] * days;
+    return costPerPerson * travelers;
+}
+
+function getMockTrips() {
+    return [
+        {
+            id: 1,
+            destination: 'Paris, France',
+            travel_days: 5,
+            budget: 'moderate',
+            travelers: 2,
+            interests: 'Sightseeing, Food, Culture',
+            created_at: '2024-01-15T10:30:00Z'
+        },
+        {
+            id: 2,
+            destination: 'Tokyo, Japan',
+            travel_days: 7,
+            budget: 'luxury',
+            travelers: 4,
+            interests: 'Food, Culture, Technology',
+            created_at: '2024-02-20T14:45:00Z'
+        },
+        {
+            id: 3,
+            destination: 'Bali, Indonesia',
+            travel_days: 8,
+            budget: 'budget',
+            travelers: 1,
+            interests: 'Nature, Relaxation, Adventure',
+            created_at: '2024-03-10T09:15:00Z'
+        }
+    ];
+}
+
+function getMockTripById(tripId) {
+    const mockTrips = getMockTrips();
+    const trip = mockTrips.find(t => t.id === tripId);
+    if (trip) {
+        return generateMockTrip(trip);
+    }
+    return null;
+}
+
+// Export functions for use in HTML onclick attributes
+window.viewSavedTrip = viewSavedTrip;
+window.downloadTripAsPDF = downloadTripAsPDF;
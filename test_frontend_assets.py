@@ -0,0 +1,105 @@
+import gzip
+import os
+import re
+
+import pytest
+
+import backend
+
+
+@pytest.fixture
+def client():
+    return backend.app.test_client()
+
+
+def static_paths(html):
+    return re.findall(r'(?:href|src)="/static/([^"]+)"', html)
+
+
+def test_index_references_fingerprinted_assets(client):
+    response = client.get('/')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+    paths = static_paths(response.get_data(as_text=True))
+    assert sorted(paths) == sorted(backend.STATIC_ASSETS)
+    assert 'css/styles.css' not in paths
+
+
+@pytest.mark.parametrize("accept, encoding", [
+    ('gzip', 'gzip'),
+    ('gzip, deflate, br', 'br'),
+    ('identity', None),
+])
+def test_content_encoding(client, accept, encoding):
+    if encoding == 'br' and backend.brotli is None:
+        pytest.skip("brotli is not installed")
+    
+    path = backend.STATIC_MANIFEST['js/app.js']
+    response = client.get(f'/static/{path}', headers={'Accept-Encoding': accept})
+    assert response.status_code == 200
+    assert response.headers.get('Content-Encoding') == encoding
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    
+    with open(os.path.join(backend.FRONTEND_STATIC_DIR, 'js', 'app.js'), 'rb') as f:
+        original = f.read()
+    if encoding == 'gzip':
+        assert gzip.decompress(response.data) == original
+    elif encoding == 'br':
+        assert backend.brotli.decompress(response.data) == original
+    else:
+        assert response.data == original
+
+
+def test_fingerprinted_asset_is_immutable(client):
+    path = backend.STATIC_MANIFEST['css/styles.css']
+    response = client.get(f'/static/{path}')
+    assert response.headers['Cache-Control'] == backend.IMMUTABLE_CACHE_CONTROL
+    assert response.mimetype == 'text/css'
+
+
+def test_unfingerprinted_asset_is_revalidated(client):
+    response = client.get('/static/css/styles.css')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+
+@pytest.mark.parametrize("url", ['/', '/static/js/app.js'])
+def test_if_none_match_returns_304(client, url):
+    headers = {'Accept-Encoding': 'gzip'}
+    etag = client.get(url, headers=headers).headers['ETag']
+    response = client.get(url, headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+
+def test_etag_differs_per_encoding(client):
+    gzipped = client.get('/', headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+    plain = client.get('/', headers={'Accept-Encoding': 'identity'}).headers['ETag']
+    assert gzipped != plain
+
+
+def test_unknown_static_path(client):
+    assert client.get('/static/js/missing.js').status_code == 404
+
+
+@pytest.mark.parametrize("origin, allowed", [
+    ('null', True),
+    ('http://localhost:8000', True),
+    ('http://127.0.0.1:5500', True),
+    ('https://evil.example', False),
+    ('http://localhost.evil.example', False),
+])
+def test_cors_only_for_local_origins(client, origin, allowed):
+    response = client.options('/login', headers={
+        'Origin': origin,
+        'Access-Control-Request-Method': 'POST',
+        'Access-Control-Request-Headers': 'content-type'
+    })
+    assert (response.headers.get('Access-Control-Allow-Origin') == origin) is allowed
+    assert 'Access-Control-Allow-Credentials' not in response.headers
+
+
+def test_api_info(client):
+    response = client.get('/api')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'running'
@@ -0,0 +1,120 @@
+import pytest
+
+from backend import JsonPatchError, apply_json_patch
+
+
+# RFC 6902 Appendix A examples that are expected to succeed
+RFC_EXAMPLES = [
+    # A.1 Adding an Object Member
+    ({"foo": "bar"},
+     [{"op": "add", "path": "/baz", "value": "qux"}],
+     {"baz": "qux", "foo": "bar"}),
+    # A.2 Adding an Array Element
+    ({"foo": ["bar", "baz"]},
+     [{"op": "add", "path": "/foo/1", "value": "qux"}],
+     {"foo": ["bar", "qux", "baz"]}),
+    # A.3 Removing an Object Member
+    ({"baz": "qux", "foo": "bar"},
+     [{"op": "remove", "path": "/baz"}],
+     {"foo": "bar"}),
+    # A.4 Removing an Array Element
+    ({"foo": ["bar", "qux", "baz"]},
+     [{"op": "remove", "path": "/foo/1"}],
+     {"foo": ["bar", "baz"]}),
+    # A.5 Replacing a Value
+    ({"baz": "qux", "foo": "bar"},
+     [{"op": "replace", "path": "/baz", "value": "boo"}],
+     {"baz": "boo", "foo": "bar"}),
+    # A.6 Moving a Value
+    ({"foo": {"bar": "baz", "waldo": "fred"}, "qux": {"corge": "grault"}},
+     [{"op": "move", "from": "/foo/waldo", "path": "/qux/thud"}],
+     {"foo": {"bar": "baz"}, "qux": {"corge": "grault", "thud": "fred"}}),
+    # A.7 Moving an Array Element
+    ({"foo": ["all", "grass", "cows", "eat"]},
+     [{"op": "move", "from": "/foo/1", "path": "/foo/3"}],
+     {"foo": ["all", "cows", "eat", "grass"]}),
+    # A.8 Testing a Value: Success
+    ({"baz": "qux", "foo": ["a", 2, "c"]},
+     [{"op": "test", "path": "/baz", "value": "qux"},
+      {"op": "test", "path": "/foo/1", "value": 2}],
+     {"baz": "qux", "foo": ["a", 2, "c"]}),
+    # A.10 Adding a Nested Member Object
+    ({"foo": "bar"},
+     [{"op": "add", "path": "/child", "value": {"grandchild": {}}}],
+     {"foo": "bar", "child": {"grandchild": {}}}),
+    # A.11 Ignoring Unrecognized Elements
+    ({"foo": "bar"},
+     [{"op": "add", "path": "/baz", "value": "qux", "xyz": 123}],
+     {"foo": "bar", "baz": "qux"}),
+    # A.14 ~ Escape Ordering
+    ({"/": 9, "~1": 10},
+     [{"op": "test", "path": "/~01", "value": 10}],
+     {"/": 9, "~1": 10}),
+    # A.16 Adding an Array Value
+    ({"foo": ["bar"]},
+     [{"op": "add", "path": "/foo/-", "value": ["abc", "def"]}],
+     {"foo": ["bar", ["abc", "def"]]}),
+]
+
+
+@pytest.mark.parametrize("document, patch, expected", RFC_EXAMPLES)
+def test_rfc_examples(document, patch, expected):
+    assert apply_json_patch(document, patch) == expected
+
+
+@pytest.mark.parametrize("document, patch", [
+    # A.9 Testing a Value: Error
+    ({"baz": "qux"}, [{"op": "test", "path": "/baz", "value": "bar"}]),
+    # A.12 Adding to a Nonexistent Target
+    ({"foo": "bar"}, [{"op": "add", "path": "/baz/bat", "value": "qux"}]),
+    # A.15 Comparing Strings and Numbers
+    ({"/": 9, "~1": 10}, [{"op": "test", "path": "/~01", "value": "10"}]),
+])
+def test_rfc_error_examples(document, patch):
+    with pytest.raises(JsonPatchError):
+        apply_json_patch(document, patch)
+
+
+def test_escaped_pointer_tokens():
+    document = {"a/b": 1, "m~n": 2}
+    patch = [{"op": "copy", "from": "/a~1b", "path": "/m~0n"}]
+    assert apply_json_patch(document, patch) == {"a/b": 1, "m~n": 1}
+
+
+@pytest.mark.parametrize("path", ["/days/2", "/days/-", "/days/01", "/days/-1", "/days/²", "/days/١"])
+def test_invalid_array_index(path):
+    with pytest.raises(JsonPatchError):
+        apply_json_patch({"days": [1, 2]}, [{"op": "replace", "path": path, "value": 0}])
+
+
+def test_add_at_end_index():
+    patch = [{"op": "add", "path": "/days/2", "value": 3}]
+    assert apply_json_patch({"days": [1, 2]}, patch) == {"days": [1, 2, 3]}
+
+
+def test_move_into_child():
+    patch = [{"op": "move", "from": "/days", "path": "/days/0/extra"}]
+    with pytest.raises(JsonPatchError):
+        apply_json_patch({"days": [{}]}, patch)
+
+
+@pytest.mark.parametrize("stored, value", [(1, True), (0, False), (True, 1), ({"a": [1]}, {"a": [True]})])
+def test_test_op_is_type_strict(stored, value):
+    with pytest.raises(JsonPatchError):
+        apply_json_patch({"x": stored}, [{"op": "test", "path": "/x", "value": value}])
+
+
+def test_test_op_compares_numbers_by_value():
+    patch = [{"op": "test", "path": "/x", "value": 1.0}]
+    assert apply_json_patch({"x": 1}, patch) == {"x": 1}
+
+
+def test_patch_is_atomic():
+    document = {"days": [{"title": "Arrival"}]}
+    patch = [
+        {"op": "replace", "path": "/days/0/title", "value": "Changed"},
+        {"op": "remove", "path": "/missing"},
+    ]
+    with pytest.raises(JsonPatchError):
+        apply_json_patch(document, patch)
+    assert document == {"days": [{"title": "Arrival"}]}
@@ -0,0 +1,146 @@
+import json
+import sqlite3
+
+import bcrypt
+import pytest
+
+import backend
+
+
+PASSWORD = 'patch12345'
+ITINERARY = {'summary': 'Two days in Paris', 'days': [{'day': 1, 'title': 'Arrival', 'activities': []}]}
+
+
+def create_user(db_path, email):
+    connection = sqlite3.connect(db_path)
+    password_hash = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    connection.execute(
+        "INSERT INTO users (name, email, password_hash) VALUES (?, ?, ?)",
+        ('Patch User', email, password_hash)
+    )
+    connection.commit()
+    connection.close()
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / 'patch.db')
+    monkeypatch.setattr(backend, 'SQLITE_DB_PATH', path)
+    backend.init_db()
+    create_user(path, 'owner@example.com')
+    create_user(path, 'other@example.com')
+    return path
+
+
+@pytest.fixture
+def client(db_path):
+    return backend.app.test_client()
+
+
+def login(client, email):
+    response = client.post('/login', json={'email': email, 'password': PASSWORD})
+    return {'Authorization': f"Bearer {response.get_json()['token']}"}
+
+
+@pytest.fixture
+def owner(client):
+    return login(client, 'owner@example.com')
+
+
+@pytest.fixture
+def trip_id(client, owner):
+    trip = {
+        'destination': 'Paris, France',
+        'travel_days': 2,
+        'budget': 'moderate',
+        'travelers': 2,
+        'interests': 'Food',
+        'itinerary': ITINERARY
+    }
+    return client.post('/save-trip', json={'trip': trip}, headers=owner).get_json()['trip_id']
+
+
+def patch(client, headers, trip_id, operations, if_match='"1"'):
+    if if_match is not None:
+        headers = {**headers, 'If-Match': if_match}
+    return client.patch(f'/trip/{trip_id}', json=operations, headers=headers)
+
+
+def stored_row(db_path, trip_id):
+    connection = sqlite3.connect(db_path)
+    row = connection.execute("SELECT itinerary_json, version FROM trips WHERE id = ?", (trip_id,)).fetchone()
+    connection.close()
+    return json.loads(row[0]), row[1]
+
+
+def assert_not_locked(db_path):
+    # Fails with "database is locked" if a PATCH left its transaction open
+    connection = sqlite3.connect(db_path, timeout=0)
+    connection.execute("BEGIN IMMEDIATE")
+    connection.rollback()
+    connection.close()
+
+
+def test_patch_bumps_version_and_etag(client, db_path, owner, trip_id):
+    response = patch(client, owner, trip_id, [{'op': 'replace', 'path': '/days/0/title', 'value': 'Landing'}])
+    assert response.status_code == 200
+    assert response.get_json()['version'] == 2
+    assert response.headers['ETag'] == '"2"'
+    
+    trip_response = client.get(f'/get-trip/{trip_id}', headers=owner)
+    assert trip_response.headers['ETag'] == response.headers['ETag']
+    assert trip_response.get_json()['trip']['version'] == 2
+    assert trip_response.get_json()['trip']['itinerary']['days'][0]['title'] == 'Landing'
+    assert_not_locked(db_path)
+
+
+@pytest.mark.parametrize("if_match", [None, '*'])
+def test_version_is_required(client, db_path, owner, trip_id, if_match):
+    response = patch(client, owner, trip_id, [], if_match=if_match)
+    assert response.status_code == 428
+    assert stored_row(db_path, trip_id) == (ITINERARY, 1)
+
+
+def test_stale_version(client, db_path, owner, trip_id):
+    assert patch(client, owner, trip_id, [{'op': 'add', 'path': '/note', 'value': 'x'}]).status_code == 200
+    
+    response = patch(client, owner, trip_id, [{'op': 'remove', 'path': '/note'}], if_match='"1"')
+    assert response.status_code == 412
+    assert response.get_json()['version'] == 2
+    assert stored_row(db_path, trip_id)[1] == 2
+    assert_not_locked(db_path)
+
+
+def test_other_users_trip(client, db_path, trip_id):
+    other = login(client, 'other@example.com')
+    response = patch(client, other, trip_id, [{'op': 'remove', 'path': '/days'}])
+    assert response.status_code == 404
+    assert stored_row(db_path, trip_id) == (ITINERARY, 1)
+    assert_not_locked(db_path)
+
+
+@pytest.mark.parametrize("operations", [
+    [{'op': 'remove', 'path': '/missing'}],
+    [{'op': 'replace', 'path': '/days/0/title', 'value': 'x'}, {'op': 'test', 'path': '/summary', 'value': 1}],
+    [{'op': 'replace', 'path': '', 'value': None}],
+])
+def test_invalid_patch_leaves_row_unchanged(client, db_path, owner, trip_id, operations):
+    response = patch(client, owner, trip_id, operations)
+    assert response.status_code == 422
+    assert stored_row(db_path, trip_id) == (ITINERARY, 1)
+    assert_not_locked(db_path)
+
+
+def test_corrupt_itinerary(client, db_path, owner, trip_id):
+    connection = sqlite3.connect(db_path)
+    connection.execute("UPDATE trips SET itinerary_json = '{bad' WHERE id = ?", (trip_id,))
+    connection.commit()
+    connection.close()
+    
+    assert patch(client, owner, trip_id, []).status_code == 409
+    assert_not_locked(db_path)
+
+
+def test_body_must_be_patch_array(client, owner, trip_id):
+    response = patch(client, owner, trip_id, {'op': 'remove', 'path': '/days'})
+    assert response.status_code == 400